@@ -4,12 +4,26 @@ File: cli/chimera.py
 
 Adds the `validate` subcommand that delegates to the core validator.
 Exit codes are CI-friendly: 0 on success, 1 on failure.
+
+argparse is only imported once a real parse is needed; `--version` is
+answered directly so trivial invocations exit without building the parser.
+Subcommands are registered as "module:function" entry strings and their
+modules are imported only after parse_args has selected one.
 """
 from __future__ import annotations
 
-import argparse
+import importlib
 import sys
-from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
+
+
+_VERSION = "chimera 1.0"
+
+# Built on first use and reused by later in-process main() calls.
+_PARSER: argparse.ArgumentParser | None = None
 
 
 def _add_validate_subcommand(subparsers: argparse._SubParsersAction) -> None:
@@ -27,45 +41,47 @@ def _add_validate_subcommand(subparsers: argparse._SubParsersAction) -> None:
         metavar="RUN_PATH",
         help="Path to the run directory (e.g., runs/20251003-refactor-auth-module)",
     )
-    p.set_defaults(func=_cmd_validate)
-
-
-def _cmd_validate(args: argparse.Namespace) -> int:
-    try:
-        from validators import validate_artifacts as va
-    except Exception as e:
-        print(f"Failed to import validator: {e}")
-        return 1
-
-    run_path = str(args.run_path)
-    try:
-        ok = va.validate_run(run_path)
-    except FileNotFoundError as e:
-        print(str(e))
-        return 1
-    except Exception as e:
-        print(f"Unexpected error during validation: {e}")
-        return 1
-
-    return 0 if ok else 1
+    p.set_defaults(entry="cli.chimera_validate:run")
 
 
 def _build_parser() -> argparse.ArgumentParser:
+    import argparse
+
     parser = argparse.ArgumentParser(prog="chimera", description="Chimera-Trunk CLI")
+    parser.add_argument("--version", action="version", version=_VERSION)
     subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
     _add_validate_subcommand(subparsers)
     return parser
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = _build_parser()
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Fast path: answer --version before paying for argparse.
+    if argv == ["--version"]:
+        sys.stdout.write(_VERSION + "\n")
+        return 0
+
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    parser = _PARSER
     args = parser.parse_args(argv)
 
-    if not hasattr(args, "func"):
+    if not hasattr(args, "entry"):
         parser.print_help()
         return 1
 
-    return int(args.func(args))
+    # Subcommand modules are imported only once parsing has picked one.
+    try:
+        mod_name, func_name = args.entry.split(":")
+        func = getattr(importlib.import_module(mod_name), func_name)
+    except Exception as e:
+        print(f"Failed to import subcommand '{args.entry}': {e}")
+        return 1
+
+    return int(func(args))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,34 @@
+"""
+Chimera-Trunk CLI: validate subcommand
+File: cli/chimera_validate.py
+
+Entry point for `chimera validate`, imported by cli/chimera.py only after
+argument parsing has selected this subcommand.
+Exit codes are CI-friendly: 0 on success, 1 on failure.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import argparse
+
+
+def run(args: argparse.Namespace) -> int:
+    try:
+        from validators import validate_artifacts as va
+    except Exception as e:
+        print(f"Failed to import validator: {e}")
+        return 1
+
+    run_path = str(args.run_path)
+    try:
+        ok = va.validate_run(run_path)
+    except FileNotFoundError as e:
+        print(str(e))
+        return 1
+    except Exception as e:
+        print(f"Unexpected error during validation: {e}")
+        return 1
+
+    return 0 if ok else 1
@@ -0,0 +1,124 @@
+"""
+Pytest harness for the Chimera-Trunk CLI
+File: tests/cli/test_chimera.py
+
+Exercises cli.chimera.main(argv) in-process: the --version fast path, the
+help fallback, lazy subcommand dispatch, and the exit codes of `validate`.
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+
+chimera = pytest.importorskip("cli.chimera", reason="CLI module not found; expected cli/chimera.py with main().")
+
+
+# -----------------------------
+# Test Utilities
+# -----------------------------
+
+_RUN_ID = "20251003-add-ci-gate"
+
+
+def _author(actor: str, role: str) -> Dict[str, Any]:
+    return {"actor": actor, "role": role, "timestamp": "2025-10-03T12:00:00Z"}
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+@pytest.fixture
+def run_dir(tmp_path: Path) -> Path:
+    """A minimal valid project with a single run; returns the run directory."""
+    root = tmp_path / "project"
+    run = root / "runs" / _RUN_ID
+    _write_json(root / "chimera.yaml", {
+        "version": "1.0",
+        "roles": {"TRUNK": ["username:Trunk"], "BRANCH": ["username:Branch"]},
+    })
+    _write_json(run / "intent.json", {
+        "schema_version": "1.0",
+        "run_id": _RUN_ID,
+        "intent": "Gate pull requests on chimera validate.",
+        "plan": ["Add workflow"],
+        "author": _author("username:Trunk", "TRUNK"),
+    })
+    _write_json(run / "instructions.json", {
+        "schema_version": "1.0",
+        "run_id": _RUN_ID,
+        "instructions": [{"step": "Add workflow", "target": ".github/workflows/chimera-gate.yml"}],
+        "author": _author("username:Branch", "BRANCH"),
+    })
+    _write_json(run / "diff.json", {
+        "schema_version": "1.0",
+        "run_id": _RUN_ID,
+        "changes": [{
+            "file_path": ".github/workflows/chimera-gate.yml",
+            "change_type": "ADD",
+            "content": "name: Chimera-Trunk Gate",
+        }],
+        "author": _author("username:Branch", "BRANCH"),
+    })
+    return run
+
+
+# -----------------------------
+# Top-level flags
+# -----------------------------
+
+def test_version_fast_path(capsys: pytest.CaptureFixture[str]) -> None:
+    assert chimera.main(["--version"]) == 0
+    assert capsys.readouterr().out == chimera._VERSION + "\n"
+
+
+def test_version_matches_argparse(capsys: pytest.CaptureFixture[str]) -> None:
+    # Not the bare fast path, so argparse's own --version action answers.
+    with pytest.raises(SystemExit) as exc:
+        chimera.main(["--version", "validate", "x"])
+    assert exc.value.code == 0
+    assert capsys.readouterr().out == chimera._VERSION + "\n"
+
+
+def test_no_command_prints_help(capsys: pytest.CaptureFixture[str]) -> None:
+    assert chimera.main([]) == 1
+    out = capsys.readouterr().out
+    assert "usage: chimera" in out and "validate" in out
+
+
+def test_help_does_not_import_validators(monkeypatch: pytest.MonkeyPatch) -> None:
+    for name in list(sys.modules):
+        if name == "validators" or name.startswith("validators."):
+            monkeypatch.delitem(sys.modules, name)
+
+    with pytest.raises(SystemExit) as exc:
+        chimera.main(["--help"])
+    assert exc.value.code == 0
+    assert "validators" not in sys.modules
+
+
+# -----------------------------
+# validate subcommand
+# -----------------------------
+
+def test_validate_success_exit_code(run_dir: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert chimera.main(["validate", str(run_dir)]) == 0
+    assert "validated" in capsys.readouterr().out.lower()
+
+
+def test_validate_failure_exit_code(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert chimera.main(["validate", str(tmp_path / "missing")]) == 1
+    assert "does not exist" in capsys.readouterr().out
+
+
+def test_unimportable_subcommand_fails_cleanly(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+    # Mirrors `python cli/chimera.py ...`, where the cli package is not importable.
+    monkeypatch.setitem(sys.modules, "cli.chimera_validate", None)
+
+    assert chimera.main(["validate", "runs/x"]) == 1
+    assert "Failed to import subcommand 'cli.chimera_validate:run'" in capsys.readouterr().out
@@ -6,33 +6,65 @@ Contract: Implements validate_run(run_path: str) -> bool to satisfy the
 pytest specification stored in Canvas. The validator performs:
   - Discovery of project root and chimera.yaml
   - Loading of intent.json, instructions.json, diff.json
-  - (Hook) JSON Schema validation (stubbed for now)
+  - JSON Schema validation against schemas/ (when a schema engine is installed)
   - Cross-file checks: run_id consistency, TRUNK/BRANCH membership, role gate
   - Clear, greppable error messages; boolean return (True on success)
 
-No external dependencies (stdlib only). JSON-as-YAML is accepted for
-chimera.yaml to avoid YAML parser dependency in tests.
+Runs on the stdlib alone; fastjsonschema (preferred) or jsonschema enables
+the schema gate, and orjson, when installed, speeds up JSON parsing.
+JSON-as-YAML is accepted for chimera.yaml to avoid YAML parser dependency
+in tests.
 """
 from __future__ import annotations
 
-import json
+import functools
+import os
+import re
 import sys
-from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, NamedTuple, Optional, Tuple
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 
 # -----------------------------
-# Utility dataclasses
+# Utility types
 # -----------------------------
 
-@dataclass
-class ArtifactBundle:
+class ArtifactBundle(NamedTuple):
     intent: Dict[str, Any]
     instructions: Dict[str, Any]
     diff: Dict[str, Any]
 
 
+_SCHEMA_DIR = Path(__file__).resolve().parent.parent / "schemas"
+
+# (artifact attribute, file name, schema file) triples checked by _schema_gate
+_SCHEMA_TARGETS = (
+    ("intent", "intent.json", "intent.schema.json"),
+    ("instructions", "instructions.json", "instructions.schema.json"),
+    ("diff", "diff.json", "diff.schema.json"),
+)
+
+# fastjsonschema's own date-time pattern, used when jsonschema lacks a checker
+_DATE_TIME_RE = re.compile(
+    r"^\d{4}-[01]\d-[0-3]\d[tT][0-2]\d:[0-5]\d:[0-5]\d(?:\.\d+)?"
+    r"(?:[+-][0-2]\d:?[0-5]\d|[zZ])\Z"
+)
+
+# validate(data) -> None on success, (field, message) on the first violation
+_SchemaCheck = Callable[[Any], Optional[Tuple[str, str]]]
+
+# Allowed values for intent.author.role
+_TRUNK_ONLY: FrozenSet[str] = frozenset(("TRUNK",))
+
+# Shared fallback for artifacts without an author block; never mutated.
+_EMPTY: Dict[str, Any] = {}
+
+
 # -----------------------------
 # Public API
 # -----------------------------
@@ -58,19 +90,17 @@ def validate_run(run_path: str) -> bool:
 
     chimera_path = project_root / "chimera.yaml"
     try:
-        chimera_cfg = _load_yaml_json(chimera_path)
+        st = os.stat(chimera_path)
+        version, trunk_roles, branch_roles = _load_chimera_config_cached(
+            str(chimera_path), st.st_mtime_ns, st.st_size
+        )
     except Exception as e:
         return _err(f"Failed to load chimera.yaml: {e}")
 
     # Enforce version pin early
-    version = str(chimera_cfg.get("version", ""))
     if version != "1.0":
         return _err(f"Unsupported chimera.yaml version '{version}'. Expected '1.0'.")
 
-    roles = chimera_cfg.get("roles") or {}
-    trunk_roles = set(_ensure_list_of_strings(roles.get("TRUNK")))
-    branch_roles = set(_ensure_list_of_strings(roles.get("BRANCH")))
-
     # 2) Load artifacts
     try:
         artifacts = _load_artifacts(run_dir)
@@ -79,7 +109,7 @@ def validate_run(run_path: str) -> bool:
     except Exception as e:
         return _err(f"Failed to load artifacts: {e}")
 
-    # 3) (Hook) Local JSON Schema validation (stubbed to always pass)
+    # 3) Local JSON Schema validation
     if not _schema_gate(artifacts):
         return False  # _schema_gate prints its own error
 
@@ -88,31 +118,24 @@ def validate_run(run_path: str) -> bool:
     if not _check_run_id_consistency(artifacts):
         return False
 
-    # 4b) Intent must be authored by TRUNK
-    intent_author = str(artifacts.intent.get("author", {}).get("actor", ""))
-    intent_role = str(artifacts.intent.get("author", {}).get("role", ""))
-
-    if intent_role != "TRUNK":
-        return _err(
-            "Intent author role must be TRUNK (file: intent.json, field: author.role)."
-        )
-    if intent_author not in trunk_roles:
-        return _err(
-            "Intent author is not a member of roles.TRUNK (file: intent.json, field: author.actor)."
-        )
-
-    # 4c) Instructions + Diff must be authored by BRANCH
-    instr_author = str(artifacts.instructions.get("author", {}).get("actor", ""))
-    diff_author = str(artifacts.diff.get("author", {}).get("actor", ""))
-
-    if instr_author not in branch_roles:
-        return _err(
-            "Instructions author is not a member of roles.BRANCH (file: instructions.json, field: author.actor)."
-        )
-    if diff_author not in branch_roles:
-        return _err(
-            "Diff author is not a member of roles.BRANCH (file: diff.json, field: author.actor)."
-        )
+    # 4b) Intent must be authored by TRUNK; 4c) Instructions + Diff by BRANCH
+    intent_author, intent_role = _author(artifacts.intent)
+    instr_author, _ = _author(artifacts.instructions)
+    diff_author, _ = _author(artifacts.diff)
+
+    checks = (
+        (intent_role, _TRUNK_ONLY,
+         "Intent author role must be TRUNK (file: intent.json, field: author.role)."),
+        (intent_author, trunk_roles,
+         "Intent author is not a member of roles.TRUNK (file: intent.json, field: author.actor)."),
+        (instr_author, branch_roles,
+         "Instructions author is not a member of roles.BRANCH (file: instructions.json, field: author.actor)."),
+        (diff_author, branch_roles,
+         "Diff author is not a member of roles.BRANCH (file: diff.json, field: author.actor)."),
+    )
+    for value, allowed, message in checks:
+        if value not in allowed:
+            return _err(message)
 
     # Success
     return _ok("Artifacts validated successfully.")
@@ -124,83 +147,176 @@ def validate_run(run_path: str) -> bool:
 
 def _find_project_root(start: Path) -> Optional[Path]:
     """Walk upward from start to locate a directory containing chimera.yaml."""
-    cur = start.resolve()
-    root = cur.anchor
-    while True:
-        candidate = cur / "chimera.yaml"
-        if candidate.exists():
-            return cur
-        if str(cur) == root:
-            return None
-        cur = cur.parent
+    root = _find_project_root_cached(str(start.resolve()))
+    return None if root is None else Path(root)
+
+
+@functools.lru_cache(maxsize=256)
+def _find_project_root_cached(dir_str: str) -> Optional[str]:
+    """Memoized upward walk over resolved directory strings.
+
+    Each level recurses into its parent's cached entry, so sibling runs under
+    one project share every ancestor lookup and each directory is stat'ed at
+    most once per process. Project roots are not expected to move during a
+    CI job.
+    """
+    if os.path.isfile(os.path.join(dir_str, "chimera.yaml")):
+        return dir_str
+    parent = os.path.dirname(dir_str)
+    if parent == dir_str:
+        return None
+    return _find_project_root_cached(parent)
 
 
 def _load_yaml_json(path: Path) -> Dict[str, Any]:
     """Load YAML by parsing it as JSON (valid since JSON is a YAML subset)."""
     text = path.read_text(encoding="utf-8")
-    return json.loads(text)
+    return _loads(text)
+
+
+@functools.lru_cache(maxsize=32)
+def _load_chimera_config_cached(
+    path_str: str, mtime_ns: int, size: int
+) -> Tuple[str, FrozenSet[str], FrozenSet[str]]:
+    """Parse chimera.yaml into (version, TRUNK roles, BRANCH roles).
+
+    Keyed on mtime and size so that validating many runs under one project
+    reads the file once, while an edited config is picked up again.
+    """
+    cfg = _load_yaml_json(Path(path_str))
+    roles = cfg.get("roles") or {}
+    return (
+        str(cfg.get("version", "")),
+        _ensure_frozenset_of_strings(roles.get("TRUNK")),
+        _ensure_frozenset_of_strings(roles.get("BRANCH")),
+    )
 
 
 def _load_json(path: Path) -> Dict[str, Any]:
-    text = path.read_text(encoding="utf-8")
-    return json.loads(text)
+    # Both orjson and json accept bytes directly, skipping the intermediate str.
+    with open(path, "rb") as f:
+        return _loads(f.read())
 
 
 def _load_artifacts(run_dir: Path) -> ArtifactBundle:
-    intent_path = run_dir / "intent.json"
-    instr_path = run_dir / "instructions.json"
-    diff_path = run_dir / "diff.json"
+    paths = {
+        "intent": run_dir / "intent.json",
+        "instructions": run_dir / "instructions.json",
+        "diff": run_dir / "diff.json",
+    }
 
-    missing = [p.name for p in (intent_path, instr_path, diff_path) if not p.exists()]
+    missing = [p.name for p in paths.values() if not p.is_file()]
     if missing:
         raise FileNotFoundError(f"Missing artifact file(s): {', '.join(missing)}")
 
-    return ArtifactBundle(
-        intent=_load_json(intent_path),
-        instructions=_load_json(instr_path),
-        diff=_load_json(diff_path),
-    )
+    return ArtifactBundle(**{name: _load_json(p) for name, p in paths.items()})
+
+
+@functools.lru_cache(maxsize=None)
+def _compiled_schema(schema_name: str) -> Optional[_SchemaCheck]:
+    """Compile a draft-07 schema from schemas/ once per process.
+
+    Prefers fastjsonschema (generated straight-line Python), falls back to
+    jsonschema, and returns None when neither is installed so the validator
+    keeps working on a bare stdlib install.
+    """
+    try:
+        import fastjsonschema
+    except ImportError:
+        pass
+    else:
+        schema = _load_json(_SCHEMA_DIR / schema_name)
+        validate = fastjsonschema.compile(schema)
+
+        def check(data: Any) -> Optional[Tuple[str, str]]:
+            try:
+                validate(data)
+            except fastjsonschema.JsonSchemaValueException as e:
+                return ".".join(e.path[1:]), e.message
+            return None
+
+        return check
+
+    try:
+        import jsonschema
+    except ImportError:
+        return None
+
+    schema = _load_json(_SCHEMA_DIR / schema_name)
+    # Enforce formats like fastjsonschema does. jsonschema only checks
+    # date-time when rfc3339-validator is installed, so fill that gap.
+    format_checker = jsonschema.FormatChecker(jsonschema.Draft7Validator.FORMAT_CHECKER.checkers)
+    if "date-time" not in format_checker.checkers:
+        format_checker.checks("date-time")(
+            lambda value: not isinstance(value, str) or _DATE_TIME_RE.match(value) is not None
+        )
+    validator = jsonschema.Draft7Validator(schema, format_checker=format_checker)
+
+    def check(data: Any) -> Optional[Tuple[str, str]]:
+        error = next(iter(validator.iter_errors(data)), None)
+        if error is None:
+            return None
+        return ".".join(str(p) for p in error.absolute_path), error.message
+
+    return check
 
 
 def _schema_gate(artifacts: ArtifactBundle) -> bool:
-    """Placeholder for JSON Schema validation against Canvas schemas.
+    """Validate each artifact against its draft-07 schema in schemas/.
 
-    Currently returns True and prints nothing, to keep tests green until
-    strict schema tests are enabled. Once integrated, this function should:
-      - Load draft-07 schemas from Canvas
-      - Validate each artifact and report specific errors
+    Validators are compiled once and reused across runs. If no schema
+    engine is installed the gate passes with a notice; cross-file checks
+    still run.
     """
-    # Example future call:
-    #   _validate_json_against_schema(artifacts.intent, "intent.schema.json")
-    #   _validate_json_against_schema(artifacts.instructions, "instructions.schema.json")
-    #   _validate_json_against_schema(artifacts.diff, "diff.schema.json")
+    for attr, file_name, schema_name in _SCHEMA_TARGETS:
+        try:
+            check = _compiled_schema(schema_name)
+        except Exception as e:
+            return _err(f"Failed to load schema {schema_name}: {e}")
+        if check is None:
+            return _ok("Schema validation skipped: no schema engine installed (fastjsonschema or jsonschema).")
+
+        failure = check(getattr(artifacts, attr))
+        if failure is not None:
+            field, message = failure
+            return _err(
+                f"Schema validation failed: {message} (file: {file_name}, field: {field or '<root>'})."
+            )
     return True
 
 
 def _check_run_id_consistency(artifacts: ArtifactBundle) -> bool:
-    rid_intent = str(artifacts.intent.get("run_id", ""))
-    rid_instr = str(artifacts.instructions.get("run_id", ""))
-    rid_diff = str(artifacts.diff.get("run_id", ""))
+    # Interned so that equal run_ids are the same object and the common
+    # (consistent) case is settled by identity checks alone.
+    rid_intent = sys.intern(str(artifacts.intent.get("run_id") or ""))
+    rid_instr = sys.intern(str(artifacts.instructions.get("run_id") or ""))
+    rid_diff = sys.intern(str(artifacts.diff.get("run_id") or ""))
 
     if not (rid_intent and rid_instr and rid_diff):
         return _err(
             "Missing run_id in one or more artifacts (files: intent.json, instructions.json, diff.json)."
         )
 
-    if not (rid_intent == rid_instr == rid_diff):
+    if not (rid_intent is rid_instr is rid_diff):
         return _err(
             f"Run ID mismatch across artifacts: intent='{rid_intent}', instructions='{rid_instr}', diff='{rid_diff}'."
         )
     return True
 
 
-def _ensure_list_of_strings(value: Any) -> Tuple[str, ...]:
+def _author(artifact: Dict[str, Any]) -> Tuple[str, str]:
+    """Return (actor, role) from an artifact's author block, '' when absent."""
+    a = artifact.get("author") or _EMPTY
+    return str(a.get("actor", "")), str(a.get("role", ""))
+
+
+def _ensure_frozenset_of_strings(value: Any) -> FrozenSet[str]:
     if value is None:
-        return tuple()
+        return frozenset()
     if isinstance(value, (list, tuple)):
-        return tuple(str(x) for x in value)
+        return frozenset(map(str, value))
     # Single string fallback for robustness
-    return (str(value),)
+    return frozenset((str(value),))
 
 
 # -----------------------------
@@ -208,10 +324,10 @@ def _ensure_list_of_strings(value: Any) -> Tuple[str, ...]:
 # -----------------------------
 
 def _err(message: str) -> bool:
-    print(message, file=sys.stdout)
+    sys.stdout.write(message + "\n")
     return False
 
 
 def _ok(message: str) -> bool:
-    print(message, file=sys.stdout)
+    sys.stdout.write(message + "\n")
     return True